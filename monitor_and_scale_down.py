@@ -7,7 +7,7 @@ when Atlas auto-scales them up to scaleUpTier. It runs safety checks and respect
 a minimum time window since the last tier update.
 
 Requirements:
-    pip install requests python-dotenv
+    pip install requests python-dotenv orjson
 
 Usage:
     python monitor_and_scale_down.py --project-id PROJECT_ID --public-key KEY --private-key KEY
@@ -16,58 +16,178 @@ Usage:
 
 import argparse
 import csv
-import json
+import functools
+import io
 import os
+import pathlib
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
+from math import sqrt
 from typing import Dict, List, Optional, Tuple
+import orjson
 import requests
+import urllib3
 from dotenv import load_dotenv
 
 load_dotenv()
 
 # Constants
 DEFAULT_METRICS_PERIOD = os.getenv("ATLAS_METRICS_PERIOD", "PT30M")
+
+# Resolved once at import instead of per lookup
+_SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+
 DEFAULT_NODE_COUNT = 3
 DEFAULT_MIN_HOURS_SINCE_UPDATE = 4  # hours
 
+# Serializes buffered per-shard diagnostic output
+_PRINT_LOCK = threading.Lock()
+
 # Validation thresholds
 CPU_THRESHOLD = 35.0  # %
 MEMORY_THRESHOLD_PERCENT = 0.6  # 60%
 IOPS_THRESHOLD_PERCENT = 0.6  # 60%
 CONNECTIONS_THRESHOLD_PERCENT = 0.5  # 50%
 NEW_SCALE_UP_THRESHOLD_HOURS = 24  # hours
+CLUSTER_CACHE_TTL_SECONDS = 60
+
+# Atlas metric name and optional value transform for each metric bucket
+METRIC_SPECS = {
+    'cpu': ("CPU_USER", None),
+    'memory': ("MEMORY_RESIDENT", lambda v: v / (1024**3)),
+    'iops': ("DISK_PARTITION_IOPS_TOTAL", None),
+    'connections': ("CONNECTIONS", None),
+}
+
+# Read-only fields Atlas returns on the cluster document that must not be
+# echoed back in a PATCH
+_READ_ONLY_FIELDS = frozenset({
+    "id", "mongoURI", "connectionStrings", "stateName", "createDate", "updateDate",
+    "links", "groupId", "replicationSpec", "mongoURIUpdated", "mongoURIWithOptions",
+    "srvAddress", "mongoDBVersion", "numShards", "name", "mongoDBMajorVersion",
+    "providerBackupEnabled", "pitEnabled", "backupEnabled", "clusterType",
+    "replicationFactor", "rootCertType", "terminationProtectionEnabled",
+    "versionReleaseSystem", "diskWarmingMode", "encryptionAtRestProvider",
+    "globalClusterSelfManagedSharding", "labels", "biConnector",
+    "customOpensslCipherConfigTls13", "minimumEnabledTlsProtocol", "tlsCipherConfigMode"
+})
+
+# Per-replicationSpec fields stripped before PATCH
+_SPEC_STRIP_FIELDS = frozenset({"id", "numShards", "zoneName"})
+
+# Header dicts reused across requests instead of being rebuilt per call
+_V2_HEADERS = {"Accept": "application/vnd.atlas.2024-10-23+json"}
+_PATCH_HEADERS = {
+    "Content-Type": "application/vnd.atlas.2024-10-23+json",
+    "Accept": "application/vnd.atlas.2024-10-23+json"
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parse ISO timestamp string to datetime object
+
+    Memoized - each shard's lastTierUpdate is parsed several times per
+    run, and the inputs are a small set of strings.
+    """
+    if not timestamp_str:
+        return None
+    try:
+        if timestamp_str.endswith('Z'):
+            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        else:
+            dt = datetime.fromisoformat(timestamp_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+    except (ValueError, TypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _tier_to_number(tier_str: str) -> int:
+    """Convert tier string (e.g., 'M30') to number (30)
+
+    Memoized - tier names are a tiny closed vocabulary compared many
+    times per run.
+    """
+    if not tier_str or not isinstance(tier_str, str):
+        return 0
+    try:
+        return int(tier_str[1:]) if tier_str[:1] in ('M', 'm', 'R', 'r') else int(tier_str)
+    except (ValueError, TypeError):
+        return 0
 
 
 class AtlasAPIClient:
     """Client for interacting with MongoDB Atlas API"""
     
-    def __init__(self, public_key: str, private_key: str, org_id: str = ""):
+    def __init__(self, public_key: str, private_key: str, org_id: str = "",
+                 project_id: str = ""):
         self.public_key = public_key
         self.private_key = private_key
         self.org_id = org_id
+        self.project_id = project_id
+        # URL bases are invariant per client - build them once
+        self._base_v1 = f"https://cloud.mongodb.com/api/atlas/v1.0/groups/{project_id}"
+        self._base_v2 = f"https://cloud.mongodb.com/api/atlas/v2/groups/{project_id}"
         self.session = requests.Session()
         self.session.auth = requests.auth.HTTPDigestAuth(public_key, private_key)
+        # The per-shard and per-metric fan-out shares this session across
+        # threads, so raise the connection pool above the default of 10 and
+        # let urllib3 retry transient Atlas errors with backoff
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=urllib3.util.Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET', 'PATCH'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        # Atlas payloads (especially the process list) compress well
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
     
-    def get_processes(self, project_id: str) -> List[Dict]:
-        """Get all processes for a project"""
+    def get_processes(self) -> List[Dict]:
+        """Get all processes for the project"""
         try:
-            url = f"https://cloud.mongodb.com/api/atlas/v1.0/groups/{project_id}/processes"
-            response = self.session.get(url)
+            response = self.session.get(self._base_v1 + "/processes")
             response.raise_for_status()
-            return response.json().get("results", [])
+            return orjson.loads(response.content).get("results", [])
         except requests.exceptions.RequestException:
             return []
     
-    def get_measurements(self, project_id: str, process_id: str, metric_name: str,
+    def get_measurements(self, process_id: str, metric_name: str,
                         granularity: str = "PT1M", period: str = "PT30M") -> Optional[Dict]:
         """Get measurements for a process"""
         try:
-            url = f"https://cloud.mongodb.com/api/atlas/v1.0/groups/{project_id}/processes/{process_id}/measurements"
+            url = self._base_v1 + f"/processes/{process_id}/measurements"
             params = {"granularity": granularity, "period": period, "m": metric_name}
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
+        except requests.exceptions.RequestException:
+            return None
+
+    def get_measurements_multi(self, process_id: str, metric_names: List[str],
+                               granularity: str = "PT1M", period: str = "PT30M") -> Optional[Dict]:
+        """Get several metrics for a process in a single request
+
+        The measurements endpoint accepts repeated m= parameters, so one
+        round-trip returns every requested metric.
+        """
+        try:
+            url = self._base_v1 + f"/processes/{process_id}/measurements"
+            params = [("granularity", granularity), ("period", period)] + \
+                     [("m", name) for name in metric_names]
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException:
             return None
 
@@ -78,28 +198,22 @@ class ScaleDownMonitor:
     def __init__(self, public_key: str, private_key: str, project_id: str,
                  metrics_period: str = "PT30M"):
         self.project_id = project_id
-        self.client = AtlasAPIClient(public_key, private_key, org_id="")
+        self.client = AtlasAPIClient(public_key, private_key, org_id="",
+                                     project_id=project_id)
         self.metrics_period = metrics_period
-        self._script_dir = os.path.dirname(os.path.abspath(__file__))
+        self._config_lock = threading.Lock()
+        self._cluster_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._processes_cache: Optional[List[Dict]] = None
+        self._processes_cache_ts = 0.0
+        self._process_index: Dict[str, List[Tuple[str, str, Dict]]] = {}
+        self._tier_specs_cache: Optional[Tuple[float, Dict]] = None
+        self._config_cache: Optional[Tuple[float, List[Dict]]] = None
+        self._etag_cache: Dict[str, Tuple[str, Dict]] = {}
     
     def _get_file_path(self, filename: str) -> str:
-        """Get absolute path for a file in the script directory"""
-        return os.path.join(self._script_dir, filename)
-    
-    def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
-        """Parse ISO timestamp string to datetime object"""
-        if not timestamp_str:
-            return None
-        try:
-            if timestamp_str.endswith('Z'):
-                dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            else:
-                dt = datetime.fromisoformat(timestamp_str)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except Exception:
-            return None
+        """Resolve a filename against the script directory unless already absolute"""
+        path = pathlib.Path(filename)
+        return str(path if path.is_absolute() else _SCRIPT_DIR / path)
     
     def _get_region_config(self, cluster_info: Dict, shard_index: int) -> Optional[Dict]:
         """Extract region config for a specific shard"""
@@ -116,64 +230,146 @@ class ScaleDownMonitor:
         
         return region_configs[0] if region_configs else None
     
-    def _tier_to_number(self, tier_str: str) -> int:
-        """Convert tier string (e.g., 'M30') to number (30)"""
-        if not tier_str or not isinstance(tier_str, str):
-            return 0
-        try:
-            if tier_str.upper().startswith(("M", "R")):
-                return int(tier_str[1:])
-            return int(tier_str)
-        except (ValueError, TypeError):
-            return 0
-    
-    def _extract_metric_values(self, measurement_data: Optional[Dict], 
-                               transform=None) -> List[float]:
-        """Extract metric values from measurement data"""
+    def _aggregate_metric(self, measurement_data: Optional[Dict],
+                          transform=None) -> Optional[Tuple[float, float, float]]:
+        """Aggregate measurement values into (max, avg, std) in a single pass
+
+        Avoids materializing the value list: filtering, the optional
+        transform, and the running max/sum/sum-of-squares all happen in
+        one loop over the raw measurements.
+        """
         if not measurement_data or "measurements" not in measurement_data:
-            return []
-        values = [m.get("value", 0) for m in measurement_data["measurements"] 
-                 if m.get("value") is not None]
-        if transform:
-            values = [transform(v) for v in values]
-        return values
+            return None
+
+        count = 0
+        total = 0.0
+        total_sq = 0.0
+        max_value = 0.0
+        for m in measurement_data["measurements"]:
+            v = m.get("value")
+            if v is None:
+                continue
+            if transform:
+                v = transform(v)
+            count += 1
+            total += v
+            total_sq += v * v
+            if v > max_value:
+                max_value = v
+
+        if count == 0:
+            return None
+        avg = total / count
+        std = sqrt(max(0.0, total_sq / count - avg * avg))
+        return max_value, avg, std
     
     def load_tier_specs(self, tier_specs_file: str = "tierConfig.csv") -> Dict:
-        """Load tier specifications from CSV file"""
+        """Load tier specifications from CSV file (cached until the file changes)"""
         tier_specs = {}
         tier_specs_path = self._get_file_path(tier_specs_file)
-        
+
         if not os.path.exists(tier_specs_path):
             print(f"Warning: Tier specs file not found: {tier_specs_path}")
             return tier_specs
-        
+
+        mtime = os.stat(tier_specs_path).st_mtime
+        if self._tier_specs_cache and self._tier_specs_cache[0] == mtime:
+            return self._tier_specs_cache[1]
+
         try:
             with open(tier_specs_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    tier = row.get('tier', '').strip()
-                    if tier:
-                        tier_specs[tier] = {
-                            'ram': float(row.get('ram', 0)),
-                            'connection': int(row.get('connection', 0)),
-                            'iops': int(row.get('iops', 0))
-                        }
-        except Exception as e:
+                # csv.reader + a header index map avoids DictReader's
+                # per-row dict allocation; the schema is fixed
+                reader = csv.reader(f)
+                header = next(reader, [])
+                idx = {name: header.index(name)
+                       for name in ('tier', 'ram', 'connection', 'iops')
+                       if name in header}
+                if len(idx) == 4:
+                    max_idx = max(idx.values())
+                    for row in reader:
+                        # Blank lines come back as [] and truncated rows as
+                        # short lists - skip them like DictReader used to
+                        if len(row) <= max_idx:
+                            continue
+                        tier = row[idx['tier']].strip()
+                        if tier:
+                            tier_specs[tier] = {
+                                'ram': float(row[idx['ram']] or 0),
+                                'connection': int(row[idx['connection']] or 0),
+                                'iops': int(row[idx['iops']] or 0)
+                            }
+            self._tier_specs_cache = (mtime, tier_specs)
+        except (OSError, csv.Error, ValueError) as e:
             print(f"Error loading tier specs: {e}")
-        
+
         return tier_specs
     
     def get_cluster_details(self, cluster_name: str) -> Optional[Dict]:
-        """Get cluster details using v2 API"""
+        """Get cluster details using v2 API (cached for CLUSTER_CACHE_TTL_SECONDS)"""
+        cached = self._cluster_cache.get(cluster_name)
+        if cached and time.monotonic() - cached[0] < CLUSTER_CACHE_TTL_SECONDS:
+            return cached[1]
+
         try:
-            url = f"https://cloud.mongodb.com/api/atlas/v2/groups/{self.project_id}/clusters/{cluster_name}"
-            headers = {"Accept": "application/vnd.atlas.2024-10-23+json"}
+            url = self.client._base_v2 + f"/clusters/{cluster_name}"
+
+            # Conditional GET: if the document is unchanged Atlas answers
+            # 304 with an empty body and we reuse the parsed copy
+            etag_entry = self._etag_cache.get(cluster_name)
+            if etag_entry:
+                headers = {**_V2_HEADERS, "If-None-Match": etag_entry[0]}
+            else:
+                headers = _V2_HEADERS
+
             response = self.client.session.get(url, headers=headers)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
+            if response.status_code == 304 and etag_entry:
+                cluster_info = etag_entry[1]
+            else:
+                response.raise_for_status()
+                cluster_info = orjson.loads(response.content)
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._etag_cache[cluster_name] = (etag, cluster_info)
+
+            self._cluster_cache[cluster_name] = (time.monotonic(), cluster_info)
+            return cluster_info
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error getting cluster details: {e}")
             return None
+
+    def invalidate_cluster_cache(self, cluster_name: str):
+        """Drop the cached cluster document after a mutating request"""
+        self._cluster_cache.pop(cluster_name, None)
+
+    def _get_processes_cached(self) -> List[Dict]:
+        """Get the project process list, cached for CLUSTER_CACHE_TTL_SECONDS"""
+        if (self._processes_cache is not None
+                and time.monotonic() - self._processes_cache_ts < CLUSTER_CACHE_TTL_SECONDS):
+            return self._processes_cache
+
+        processes = self.client.get_processes()
+        if processes:
+            self._processes_cache = processes
+            self._processes_cache_ts = time.monotonic()
+            self._process_index = {}
+        return processes
+
+    def _get_cluster_process_bucket(self, cluster_id: str) -> List[Tuple[str, str, Dict]]:
+        """Filter the project process list down to one cluster's processes.
+
+        Returns (replica_set_lower, type_name, process) tuples with the
+        compared fields lowercased up front, and caches the bucket so N
+        shard lookups for the same cluster scan the full process list and
+        allocate the lowered strings only once.
+        """
+        bucket = self._process_index.get(cluster_id)
+        if bucket is None:
+            bucket = [((p.get("replicaSetName") or "").lower(), p.get("typeName", ""), p)
+                      for p in self._get_processes_cached()
+                      if cluster_id in p.get("hostname", "").lower()]
+            self._process_index[cluster_id] = bucket
+        return bucket
     
     def get_cluster_process_for_shard(self, cluster_name: str, cluster_info: Dict,
                                      shard_index: int) -> Optional[Dict]:
@@ -182,28 +378,22 @@ class ScaleDownMonitor:
         if not replication_specs or shard_index < 0 or shard_index >= len(replication_specs):
             return None
         
-        processes = self.client.get_processes(self.project_id)
-        if not processes:
-            return None
-        
         cluster_id = cluster_name.lower().replace("cluster", "")
+        bucket = self._get_cluster_process_bucket(cluster_id)
+        if not bucket:
+            return None
+
+        # Target replica-set token, computed once instead of per process
+        shard_token = f"shard-{shard_index - 1}" if shard_index != 0 else None
         candidates = []
-        
-        for p in processes:
-            hostname = p.get("hostname", "")
-            if cluster_id not in hostname.lower():
-                continue
-            
-            replica_set = (p.get("replicaSetName") or "").lower()
-            type_name = p.get("typeName", "")
-            
+
+        for replica_set, type_name, p in bucket:
             # Match based on shard_index
-            matched = False
             if shard_index == 0:
-                matched = "config-0" in replica_set or "config" in replica_set or "shard-0" in replica_set
+                matched = "config" in replica_set or "shard-0" in replica_set
             else:
-                matched = f"shard-{shard_index - 1}" in replica_set
-            
+                matched = shard_token in replica_set
+
             if matched:
                 if type_name in ["REPLICA_PRIMARY", "SHARD_CONFIG_PRIMARY"]:
                     return p
@@ -219,50 +409,44 @@ class ScaleDownMonitor:
             return self._default_metrics()
         
         metrics = self._default_metrics()
-        
-        # CPU metrics
-        cpu_data = self.client.get_measurements(
-            self.project_id, process_id, "CPU_USER",
+
+        # One round-trip returns all four metrics; route the returned
+        # measurement entries back to their buckets by metric name
+        name_to_key = {name: key for key, (name, _) in METRIC_SPECS.items()}
+        data = self.client.get_measurements_multi(
+            process_id, list(name_to_key),
             granularity="PT1M", period=self.metrics_period
         )
-        cpu_values = self._extract_metric_values(cpu_data)
-        if cpu_values:
-            metrics['cpu_max'] = max(cpu_values)
-            metrics['cpu_avg'] = sum(cpu_values) / len(cpu_values)
-            if len(cpu_values) > 1:
-                variance = sum((x - metrics['cpu_avg']) ** 2 for x in cpu_values) / len(cpu_values)
-                metrics['cpu_std'] = variance ** 0.5
-        
+        if not data or "measurements" not in data:
+            return metrics
+
+        buckets = {key: [] for key in METRIC_SPECS}
+        for measurement in data["measurements"]:
+            key = name_to_key.get(measurement.get("name"))
+            if key is not None:
+                buckets[key].append(measurement)
+
+        # CPU metrics
+        cpu_stats = self._aggregate_metric({"measurements": buckets['cpu']})
+        if cpu_stats:
+            metrics['cpu_max'], metrics['cpu_avg'], metrics['cpu_std'] = cpu_stats
+
         # Memory metrics
-        memory_data = self.client.get_measurements(
-            self.project_id, process_id, "MEMORY_RESIDENT",
-            granularity="PT1M", period=self.metrics_period
-        )
-        memory_values = self._extract_metric_values(memory_data, lambda v: v / (1024**3))
-        if memory_values:
-            metrics['memory_max_gb'] = max(memory_values)
-            metrics['memory_avg_gb'] = sum(memory_values) / len(memory_values)
-        
+        memory_stats = self._aggregate_metric({"measurements": buckets['memory']},
+                                              METRIC_SPECS['memory'][1])
+        if memory_stats:
+            metrics['memory_max_gb'], metrics['memory_avg_gb'], _ = memory_stats
+
         # IOPS metrics
-        iops_data = self.client.get_measurements(
-            self.project_id, process_id, "DISK_PARTITION_IOPS_TOTAL",
-            granularity="PT1M", period=self.metrics_period
-        )
-        iops_values = self._extract_metric_values(iops_data)
-        if iops_values:
-            metrics['iops_max'] = max(iops_values)
-            metrics['iops_avg'] = sum(iops_values) / len(iops_values)
-        
+        iops_stats = self._aggregate_metric({"measurements": buckets['iops']})
+        if iops_stats:
+            metrics['iops_max'], metrics['iops_avg'], _ = iops_stats
+
         # Connections metrics
-        conn_data = self.client.get_measurements(
-            self.project_id, process_id, "CONNECTIONS",
-            granularity="PT1M", period=self.metrics_period
-        )
-        conn_values = self._extract_metric_values(conn_data)
-        if conn_values:
-            metrics['connections_max'] = max(conn_values)
-            metrics['connections_avg'] = sum(conn_values) / len(conn_values)
-        
+        conn_stats = self._aggregate_metric({"measurements": buckets['connections']})
+        if conn_stats:
+            metrics['connections_max'], metrics['connections_avg'], _ = conn_stats
+
         return metrics
     
     def _default_metrics(self) -> Dict:
@@ -313,19 +497,27 @@ class ScaleDownMonitor:
         
         return len(reasons) == 0, reasons
     
-    def check_shard_tier(self, cluster_info: Dict, shard_index: int) -> Optional[str]:
-        """Get current tier for a specific shard"""
-        region_config = self._get_region_config(cluster_info, shard_index)
+    def check_shard_tier(self, cluster_info: Dict, shard_index: int,
+                         region_config: Optional[Dict] = None) -> Optional[str]:
+        """Get current tier for a specific shard
+
+        Pass region_config when the caller has already resolved it to skip
+        the replicationSpecs traversal.
+        """
+        if region_config is None:
+            region_config = self._get_region_config(cluster_info, shard_index)
         if region_config:
             effective_specs = region_config.get("effectiveElectableSpecs", {})
             return effective_specs.get("instanceSize")
         return None
-    
+
     def check_autoscale_limits(self, cluster_info: Dict, shard_index: int,
-                               base_tier: str, scale_up_tier: str) -> Tuple[bool, List[str]]:
+                               base_tier: str, scale_up_tier: str,
+                               region_config: Optional[Dict] = None) -> Tuple[bool, List[str]]:
         """Check if baseTier and scaleUpTier are within autoscale limits"""
         reasons = []
-        region_config = self._get_region_config(cluster_info, shard_index)
+        if region_config is None:
+            region_config = self._get_region_config(cluster_info, shard_index)
         if not region_config:
             reasons.append(f"No region config found for shard[{shard_index}]")
             return False, reasons
@@ -341,10 +533,10 @@ class ScaleDownMonitor:
             reasons.append(f"Autoscale min/max not configured for shard[{shard_index}]")
             return False, reasons
         
-        base_num = self._tier_to_number(base_tier)
-        scale_up_num = self._tier_to_number(scale_up_tier)
-        min_num = self._tier_to_number(min_instance_size)
-        max_num = self._tier_to_number(max_instance_size)
+        base_num = _tier_to_number(base_tier)
+        scale_up_num = _tier_to_number(scale_up_tier)
+        min_num = _tier_to_number(min_instance_size)
+        max_num = _tier_to_number(max_instance_size)
         
         if base_num < min_num or base_num > max_num:
             reasons.append(f"baseTier {base_tier} outside autoscale limits [{min_instance_size}, {max_instance_size}]")
@@ -358,7 +550,7 @@ class ScaleDownMonitor:
         if not last_tier_update:
             return True, None
         
-        last_update = self._parse_timestamp(last_tier_update)
+        last_update = _parse_timestamp(last_tier_update)
         if not last_update:
             return True, None
         
@@ -372,7 +564,7 @@ class ScaleDownMonitor:
         if not last_tier_update:
             return True, None
         
-        last_update = self._parse_timestamp(last_tier_update)
+        last_update = _parse_timestamp(last_tier_update)
         if not last_update:
             return True, None
         
@@ -383,187 +575,232 @@ class ScaleDownMonitor:
     def update_cluster_shards(self, cluster_name: str, shard_updates: List[Dict],
                               target_tier: str, scale_up_tier: str) -> bool:
         """Update multiple shards in a single PATCH request"""
+        cluster_info = self.get_cluster_details(cluster_name)
+        if not cluster_info:
+            return False
+
+        # Shallow-copy the top level (read-only fields are popped from it
+        # below) and reserialize only replicationSpecs, the sole subtree
+        # we mutate - far cheaper than deep-copying the whole document
+        # and keeps the cached original untouched
+        update_payload = {k: v for k, v in cluster_info.items()}
+        update_payload["replicationSpecs"] = orjson.loads(
+            orjson.dumps(cluster_info.get("replicationSpecs", []))
+        )
+        original_replication_specs = cluster_info.get("replicationSpecs", [])
+
+        # Remove read-only fields
+        for field in list(update_payload.keys()):
+            if field in _READ_ONLY_FIELDS:
+                del update_payload[field]
+
+        replication_specs = update_payload.get("replicationSpecs", [])
+        if len(replication_specs) != len(original_replication_specs):
+            print(f"  ✗ ERROR: replicationSpecs count mismatch!")
+            return False
+
+        provider_name = cluster_info.get("providerSettings", {}).get("providerName", "AWS")
+        update_payload.pop("autoScaling", None)
+        update_payload.pop("providerSettings", None)
+        update_payload.pop("diskSizeGB", None)
+
+        # Process all replicationSpecs
+        for spec in replication_specs:
+            for field in _SPEC_STRIP_FIELDS:
+                spec.pop(field, None)
+
+            if "regionsConfig" in spec and "regionConfigs" not in spec:
+                regions_config_obj = spec.pop("regionsConfig")
+                region_configs = []
+                for region_name, region_data in regions_config_obj.items():
+                    region_config = {
+                        "priority": region_data.get("priority", 7),
+                        "regionName": region_name,
+                        "providerName": provider_name,
+                    }
+                    for key in ["electableSpecs", "analyticsSpecs", "readOnlySpecs", "autoScaling"]:
+                        if key in region_data:
+                            region_config[key] = region_data[key]
+                    region_configs.append(region_config)
+                spec["regionConfigs"] = region_configs
+
+        # Update target shards
+        for update in shard_updates:
+            shard_index = update['shard_index']
+            current_disk_size = update['current_disk_size']
+
+            if shard_index < 0 or shard_index >= len(replication_specs):
+                print(f"  ✗ Error: shard_index {shard_index} out of range")
+                continue
+
+            region_config = self._get_region_config(update_payload, shard_index)
+            if not region_config:
+                print(f"  ✗ Error: No region configs found for shard[{shard_index}]")
+                continue
+
+            # Update electableSpecs
+            if "electableSpecs" in region_config:
+                region_config["electableSpecs"]["instanceSize"] = target_tier
+                region_config["electableSpecs"]["nodeCount"] = DEFAULT_NODE_COUNT
+                region_config["electableSpecs"]["diskSizeGB"] = int(current_disk_size)
+                region_config["electableSpecs"].pop("diskIOPS", None)
+                region_config["electableSpecs"]["ebsVolumeType"] = "STANDARD"
+                print(f"  Updated replicationSpecs[{shard_index}] to {target_tier}, disk: {current_disk_size}GB")
+            else:
+                print(f"  ✗ Error: No electableSpecs found for shard[{shard_index}]")
+                continue
+
+            # Note: We do NOT modify autoscale settings - they remain as configured in Atlas
+
+        # Verify all replicationSpecs are included
+        final_replication_specs = update_payload.get("replicationSpecs", [])
+        if len(final_replication_specs) != len(original_replication_specs):
+            print(f"  ✗ FATAL ERROR: Update payload is missing replicationSpecs!")
+            return False
+
+        # Make PATCH request - only the network call needs the guard
+        url = self.client._base_v2 + f"/clusters/{cluster_name}"
+
+        print(f"  Making PATCH request with {len(final_replication_specs)} replicationSpecs...")
         try:
-            cluster_info = self.get_cluster_details(cluster_name)
-            if not cluster_info:
-                return False
-            
-            import copy
-            update_payload = copy.deepcopy(cluster_info)
-            original_replication_specs = cluster_info.get("replicationSpecs", [])
-            
-            # Remove read-only fields
-            read_only_fields = [
-                "id", "mongoURI", "connectionStrings", "stateName", "createDate", "updateDate",
-                "links", "groupId", "replicationSpec", "mongoURIUpdated", "mongoURIWithOptions",
-                "srvAddress", "mongoDBVersion", "numShards", "name", "mongoDBMajorVersion",
-                "providerBackupEnabled", "pitEnabled", "backupEnabled", "clusterType",
-                "replicationFactor", "rootCertType", "terminationProtectionEnabled",
-                "versionReleaseSystem", "diskWarmingMode", "encryptionAtRestProvider",
-                "globalClusterSelfManagedSharding", "labels", "biConnector",
-                "customOpensslCipherConfigTls13", "minimumEnabledTlsProtocol", "tlsCipherConfigMode"
-            ]
-            for field in read_only_fields:
-                update_payload.pop(field, None)
-            
-            replication_specs = update_payload.get("replicationSpecs", [])
-            if len(replication_specs) != len(original_replication_specs):
-                print(f"  ✗ ERROR: replicationSpecs count mismatch!")
-                return False
-            
-            provider_name = cluster_info.get("providerSettings", {}).get("providerName", "AWS")
-            update_payload.pop("autoScaling", None)
-            update_payload.pop("providerSettings", None)
-            update_payload.pop("diskSizeGB", None)
-            
-            # Process all replicationSpecs
-            for spec in replication_specs:
-                spec.pop("id", None)
-                spec.pop("numShards", None)
-                spec.pop("zoneName", None)
-                
-                if "regionsConfig" in spec and "regionConfigs" not in spec:
-                    regions_config_obj = spec.pop("regionsConfig")
-                    region_configs = []
-                    for region_name, region_data in regions_config_obj.items():
-                        region_config = {
-                            "priority": region_data.get("priority", 7),
-                            "regionName": region_name,
-                            "providerName": provider_name,
-                        }
-                        for key in ["electableSpecs", "analyticsSpecs", "readOnlySpecs", "autoScaling"]:
-                            if key in region_data:
-                                region_config[key] = region_data[key]
-                        region_configs.append(region_config)
-                    spec["regionConfigs"] = region_configs
-            
-            # Update target shards
-            for update in shard_updates:
-                shard_index = update['shard_index']
-                current_disk_size = update['current_disk_size']
-                
-                if shard_index < 0 or shard_index >= len(replication_specs):
-                    print(f"  ✗ Error: shard_index {shard_index} out of range")
-                    continue
-                
-                region_config = self._get_region_config(update_payload, shard_index)
-                if not region_config:
-                    print(f"  ✗ Error: No region configs found for shard[{shard_index}]")
-                    continue
-                
-                # Update electableSpecs
-                if "electableSpecs" in region_config:
-                    region_config["electableSpecs"]["instanceSize"] = target_tier
-                    region_config["electableSpecs"]["nodeCount"] = DEFAULT_NODE_COUNT
-                    region_config["electableSpecs"]["diskSizeGB"] = int(current_disk_size)
-                    region_config["electableSpecs"].pop("diskIOPS", None)
-                    region_config["electableSpecs"]["ebsVolumeType"] = "STANDARD"
-                    print(f"  Updated replicationSpecs[{shard_index}] to {target_tier}, disk: {current_disk_size}GB")
-                else:
-                    print(f"  ✗ Error: No electableSpecs found for shard[{shard_index}]")
-                    continue
-                
-                # Note: We do NOT modify autoscale settings - they remain as configured in Atlas
-            
-            # Verify all replicationSpecs are included
-            final_replication_specs = update_payload.get("replicationSpecs", [])
-            if len(final_replication_specs) != len(original_replication_specs):
-                print(f"  ✗ FATAL ERROR: Update payload is missing replicationSpecs!")
-                return False
-            
-            # Make PATCH request
-            url = f"https://cloud.mongodb.com/api/atlas/v2/groups/{self.project_id}/clusters/{cluster_name}"
-            headers = {
-                "Content-Type": "application/vnd.atlas.2024-10-23+json",
-                "Accept": "application/vnd.atlas.2024-10-23+json"
-            }
-            
-            print(f"  Making PATCH request with {len(final_replication_specs)} replicationSpecs...")
-            response = self.client.session.patch(url, json=update_payload, headers=headers)
+            response = self.client.session.patch(url, data=orjson.dumps(update_payload),
+                                                 headers=_PATCH_HEADERS)
             response.raise_for_status()
-            
-            print(f"  ✓ Scale-down request submitted for {len(shard_updates)} shard(s) to {target_tier}")
-            return True
-        except Exception as e:
+        except requests.RequestException as e:
             print(f"  ✗ Error updating cluster: {e}")
             return False
+
+        print(f"  ✓ Scale-down request submitted for {len(shard_updates)} shard(s) to {target_tier}")
+        return True
     
-    def update_config_timestamp(self, config_file: str, cluster_name: str, shard_index: int):
-        """Update lastTierUpdate timestamp for a shard"""
+    def _load_config(self, config_path: str) -> List[Dict]:
+        """Read the cluster config JSON, reusing the parsed copy while the
+        file is unchanged on disk"""
+        mtime = os.stat(config_path).st_mtime
+        if self._config_cache and self._config_cache[0] == mtime:
+            return self._config_cache[1]
+
+        with open(config_path, 'rb') as f:
+            data = orjson.loads(f.read())
+        self._config_cache = (mtime, data)
+        return data
+
+    def update_config_timestamps(self, config_file: str, cluster_name: str,
+                                 shard_indices: List[int]):
+        """Update lastTierUpdate for several shards in one read-modify-write"""
         try:
             config_path = self._get_file_path(config_file)
-            with open(config_path, 'r') as f:
-                data = json.load(f)
-            
-            now_iso = datetime.now(timezone.utc).isoformat()
-            for entry in data:
-                if entry.get('clusterName') == cluster_name:
-                    for shard in entry.get('shards', []):
-                        if shard.get('shardIndex') == shard_index:
-                            shard['lastTierUpdate'] = now_iso
-                            break
-            
-            with open(config_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            print(f"  Updated lastTierUpdate for {cluster_name} shard[{shard_index}]")
-        except Exception as e:
-            print(f"  Warning: Could not update config file: {e}")
+            shard_index_set = set(shard_indices)
+            with self._config_lock:
+                data = self._load_config(config_path)
+
+                now_iso = datetime.now(timezone.utc).isoformat()
+                for entry in data:
+                    if entry.get('clusterName') == cluster_name:
+                        for shard in entry.get('shards', []):
+                            if shard.get('shardIndex') in shard_index_set:
+                                shard['lastTierUpdate'] = now_iso
+
+                # Write to a temp file and rename so a crash mid-write can
+                # never leave a truncated config behind
+                tmp_path = config_path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                os.replace(tmp_path, config_path)
+                self._config_cache = (os.stat(config_path).st_mtime, data)
+
+            with _PRINT_LOCK:
+                print(f"  Updated lastTierUpdate for {cluster_name} shard(s) {sorted(shard_index_set)}")
+        except (OSError, orjson.JSONDecodeError) as e:
+            with _PRINT_LOCK:
+                print(f"  Warning: Could not update config file: {e}")
+
+    def update_config_timestamp(self, config_file: str, cluster_name: str, shard_index: int):
+        """Update lastTierUpdate timestamp for a shard"""
+        self.update_config_timestamps(config_file, cluster_name, [shard_index])
     
     def check_and_scale_down_shard(self, cluster_name: str, shard_index: int,
                                    base_tier: str, scale_up_tier: str,
                                    last_tier_update: str, min_hours: int,
                                    config_file: str, tier_specs: Dict) -> Optional[Dict]:
-        """Check a shard and scale down if needed"""
-        print(f"\n  Checking shard[{shard_index}]...")
+        """Check a shard and scale down if needed
+
+        Diagnostics are buffered per shard and written to stdout in one
+        atomic chunk so the concurrent shard checks don't interleave
+        their check/skip reasons.
+        """
+        buf = io.StringIO()
+        try:
+            return self._check_and_scale_down_shard_impl(
+                cluster_name, shard_index, base_tier, scale_up_tier,
+                last_tier_update, min_hours, config_file, tier_specs, buf
+            )
+        finally:
+            with _PRINT_LOCK:
+                sys.stdout.write(buf.getvalue())
+                sys.stdout.flush()
+
+    def _check_and_scale_down_shard_impl(self, cluster_name: str, shard_index: int,
+                                         base_tier: str, scale_up_tier: str,
+                                         last_tier_update: str, min_hours: int,
+                                         config_file: str, tier_specs: Dict,
+                                         buf: io.StringIO) -> Optional[Dict]:
+        def out(msg: str = ""):
+            buf.write(f"{msg}\n")
+
+        out(f"\n  Checking shard[{shard_index}]...")
         
         cluster_info = self.get_cluster_details(cluster_name)
         if not cluster_info:
-            print(f"  ✗ Could not get cluster details")
+            out(f"  ✗ Could not get cluster details")
             return None
         
-        current_tier = self.check_shard_tier(cluster_info, shard_index)
+        # Resolve the shard's region config once and reuse it for the tier,
+        # autoscale-limit and disk-size reads below
+        region_config = self._get_region_config(cluster_info, shard_index)
+
+        current_tier = self.check_shard_tier(cluster_info, shard_index, region_config)
         if not current_tier:
-            print(f"  ✗ Could not determine current tier")
+            out(f"  ✗ Could not determine current tier")
             return None
         
-        print(f"    Current tier: {current_tier}")
+        out(f"    Current tier: {current_tier}")
         
         # Tier state check
         if current_tier == base_tier:
-            print(f"    Shard is at baseTier {base_tier} - no action needed")
+            out(f"    Shard is at baseTier {base_tier} - no action needed")
             return None
         
         if current_tier != scale_up_tier:
-            print(f"    Shard is at {current_tier} (not baseTier or scaleUpTier) - skipping")
+            out(f"    Shard is at {current_tier} (not baseTier or scaleUpTier) - skipping")
             return None
         
-        print(f"    Shard is at scaleUpTier {scale_up_tier} - checking if we should scale down...")
+        out(f"    Shard is at scaleUpTier {scale_up_tier} - checking if we should scale down...")
         
         # Tier specification check
         if base_tier not in tier_specs:
-            print(f"    ✗ No tier specs found for baseTier {base_tier} - scale-down blocked")
+            out(f"    ✗ No tier specs found for baseTier {base_tier} - scale-down blocked")
             return None
-        print(f"    ✓ Tier specification check passed")
+        out(f"    ✓ Tier specification check passed")
         
         # Autoscale limits check
         autoscale_valid, autoscale_reasons = self.check_autoscale_limits(
-            cluster_info, shard_index, base_tier, scale_up_tier
+            cluster_info, shard_index, base_tier, scale_up_tier, region_config
         )
         if not autoscale_valid:
-            print(f"    ✗ Autoscale limits check failed:")
+            out(f"    ✗ Autoscale limits check failed:")
             for reason in autoscale_reasons:
-                print(f"      - {reason}")
+                out(f"      - {reason}")
             return None
-        print(f"    ✓ Autoscale limits check passed")
+        out(f"    ✓ Autoscale limits check passed")
         
         # Check for new scale-up event
         is_very_old, time_diff_old = self.is_timestamp_very_old(last_tier_update)
         if is_very_old:
             hours_old = time_diff_old.total_seconds() / 3600 if time_diff_old else None
             status = f"(timestamp is {hours_old:.1f} hours old)" if hours_old else "(no previous timestamp)"
-            print(f"    → Detected new scale-up event {status}")
-            print(f"    → Updating lastTierUpdate to now (first detection, no scale-down)")
+            out(f"    → Detected new scale-up event {status}")
+            out(f"    → Updating lastTierUpdate to now (first detection, no scale-down)")
             self.update_config_timestamp(config_file, cluster_name, shard_index)
             return None
         
@@ -571,36 +808,35 @@ class ScaleDownMonitor:
         can_scale, time_diff = self.check_time_since_update(last_tier_update, min_hours)
         if not can_scale:
             hours_passed = time_diff.total_seconds() / 3600 if time_diff else 0
-            print(f"    ⏳ Waiting period: {hours_passed:.1f} hours < {min_hours} hours required")
-            print(f"    → Will check again in next run")
+            out(f"    ⏳ Waiting period: {hours_passed:.1f} hours < {min_hours} hours required")
+            out(f"    → Will check again in next run")
             return None
         
         if time_diff:
             hours_passed = time_diff.total_seconds() / 3600
-            print(f"    ✓ Time check passed: {hours_passed:.1f} hours >= {min_hours} hours")
+            out(f"    ✓ Time check passed: {hours_passed:.1f} hours >= {min_hours} hours")
         
         # Get metrics
         primary_process = self.get_cluster_process_for_shard(cluster_name, cluster_info, shard_index)
         if not primary_process:
-            print(f"    ✗ Could not find primary process")
+            out(f"    ✗ Could not find primary process")
             return None
         
-        print(f"    Fetching metrics...")
+        out(f"    Fetching metrics...")
         metrics = self.get_cluster_metrics(cluster_name, cluster_info, primary_process)
         
         # Safety checks
-        print(f"    Checking safety conditions...")
+        out(f"    Checking safety conditions...")
         safe, reasons = self.check_safety_conditions(base_tier, current_tier, metrics, tier_specs)
         if not safe:
-            print(f"    ✗ Safety checks failed:")
+            out(f"    ✗ Safety checks failed:")
             for reason in reasons:
-                print(f"      - {reason}")
+                out(f"      - {reason}")
             return None
         
-        print(f"    ✓ Safety checks passed")
+        out(f"    ✓ Safety checks passed")
         
         # Get current disk size
-        region_config = self._get_region_config(cluster_info, shard_index)
         current_disk_size = 80.0
         if region_config:
             effective_specs = region_config.get("effectiveElectableSpecs", {})
@@ -617,25 +853,41 @@ class ScaleDownMonitor:
         print(f"  baseTier: {base_tier}, scaleUpTier: {scale_up_tier}")
         print(f"{'='*60}")
         
+        # Each shard check is dominated by Atlas round-trips, so run the
+        # read-only analysis for all shards concurrently; only the final
+        # PATCH below is serialized per cluster
+        # Start each invocation with fresh process data, then prime the
+        # cluster-details cache once so every shard check in this pass
+        # reuses the same document instead of refetching it
+        self._processes_cache = None
+        self._process_index = {}
+        self.get_cluster_details(cluster_name)
+
         shard_updates = []
-        for shard_config in shards_config:
-            shard_index = shard_config.get('shardIndex')
-            if shard_index is None:
-                continue
-            
-            result = self.check_and_scale_down_shard(
-                cluster_name, shard_index, base_tier, scale_up_tier,
-                shard_config.get('lastTierUpdate', ''), min_hours, config_file, tier_specs
-            )
-            
-            if isinstance(result, dict):
-                shard_updates.append(result)
+        valid_shards = [sc for sc in shards_config if sc.get('shardIndex') is not None]
+        if valid_shards:
+            with ThreadPoolExecutor(max_workers=min(8, len(valid_shards))) as executor:
+                futures = {
+                    executor.submit(
+                        self.check_and_scale_down_shard,
+                        cluster_name, sc['shardIndex'], base_tier, scale_up_tier,
+                        sc.get('lastTierUpdate', ''), min_hours, config_file, tier_specs
+                    ): sc
+                    for sc in valid_shards
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if isinstance(result, dict):
+                        shard_updates.append(result)
         
         if shard_updates:
             print(f"\n  Updating {len(shard_updates)} shard(s) in a single request...")
             if self.update_cluster_shards(cluster_name, shard_updates, base_tier, scale_up_tier):
-                for update in shard_updates:
-                    self.update_config_timestamp(config_file, cluster_name, update['shard_index'])
+                self.invalidate_cluster_cache(cluster_name)
+                self.update_config_timestamps(
+                    config_file, cluster_name,
+                    [update['shard_index'] for update in shard_updates]
+                )
                 print(f"\n✓ Scaled down {len(shard_updates)} shard(s) for {cluster_name}")
             else:
                 print(f"\n✗ Failed to scale down shards for {cluster_name}")
@@ -676,8 +928,8 @@ def main():
         print(f"Error: Config file not found: {config_path}")
         sys.exit(1)
     
-    with open(config_path, 'r') as f:
-        cluster_entries = json.load(f)
+    with open(config_path, 'rb') as f:
+        cluster_entries = orjson.loads(f.read())
     
     for entry in cluster_entries:
         cluster_name = (entry.get('clusterName') or '').strip()